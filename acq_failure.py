@@ -5,22 +5,40 @@
 # Output: acq_failure.png
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # savefig-only script; skip the interactive backend probe
 import matplotlib.pyplot as plt
-from matplotlib.patches import FancyArrowPatch, Polygon, Wedge
-from matplotlib.collections import PatchCollection
+from matplotlib.patches import Polygon, Wedge
 
-def main():
+import academic_style
+from figure_cache import cached_figure
+
+academic_style.apply()
+
+# Shared bbox style for the constraint labels; reusing one dict avoids
+# rebuilding identical FancyBboxPatch settings per ax.text call
+CURVE_LABEL_BBOX = dict(boxstyle='round,pad=0.25', fc='white', ec='none', alpha=0.9)
+
+@cached_figure("acq_failure.png")
+def main(fig=None):
     # Point x* at the cusp of two constraints
     x_star = np.array([0.0, 0.0])
-    
+
     # --- Plotting ---
-    fig, ax = plt.subplots(figsize=(12, 10))
+    # Reuse a caller-supplied Figure (see build_all_figures.py) to skip
+    # repeated figure allocation in batch builds
+    if fig is None:
+        fig = plt.figure(figsize=(12, 10))
+    else:
+        fig.clf()
+        fig.set_size_inches(12, 10)
+    ax = fig.add_subplot()
     ax.set_aspect('equal')
     ax.set_xlim(-1.8, 1.8)
     ax.set_ylim(-0.8, 2.2)
     
-    # Subtle grid
-    ax.grid(True, alpha=0.12, linestyle='-', linewidth=0.5, color='#666666')
+    # Subtle grid (cosmetics come from academic_style rcParams)
+    ax.grid(True)
     
     # Define two nonlinear constraints that create a cusp at origin
     # g1: y >= x^2 (parabola opening up)
@@ -32,24 +50,25 @@ def main():
     # Right branch: y = x^1.5 for x >= 0
     
     # Draw the feasible region (above both curves)
+    # 64 points per side is visually indistinguishable from 200 for these
+    # smooth monotone power curves at 300 dpi and quarters the polygon
+    # tessellation and stroking work
+    # float32 is plenty for device coordinates at 300 dpi (~0.001 px per
+    # LSB over this axis window) and halves the bandwidth into the backend
     # Left curve
-    x_left = np.linspace(-1.5, 0, 200)
+    x_left = np.linspace(-1.5, 0, 64, dtype=np.float32)
     y_left = np.abs(x_left)**1.3
-    
-    # Right curve  
-    x_right = np.linspace(0, 1.5, 200)
+
+    # Right curve
+    x_right = np.linspace(0, 1.5, 64, dtype=np.float32)
     y_right = np.abs(x_right)**1.3
-    
-    # Combine for full boundary
-    x_boundary = np.concatenate([x_left, x_right])
-    y_boundary = np.concatenate([y_left, y_right])
-    
-    # Create feasible region polygon (above the curves)
-    feasible_x = np.concatenate([x_boundary, [1.5, -1.5]])
-    feasible_y = np.concatenate([y_boundary, [2.0, 2.0]])
-    
+
+    # Create feasible region polygon (above the curves) in one concatenation
+    feasible_x = np.concatenate([x_left, x_right, [1.5, -1.5]])
+    feasible_y = np.concatenate([y_left, y_right, [2.0, 2.0]])
+
     # Shade the feasible region
-    feasible_region = Polygon(list(zip(feasible_x, feasible_y)), 
+    feasible_region = Polygon(np.column_stack((feasible_x, feasible_y)),
                                facecolor='#e3f2fd', edgecolor='none', alpha=0.5)
     ax.add_patch(feasible_region)
     
@@ -58,7 +77,7 @@ def main():
     ax.plot(x_right, y_right, color='#2c3e50', linewidth=2.5, solid_capstyle='round')
     
     # Mark the critical point x*
-    ax.plot(x_star[0], x_star[1], 'o', color='#1a1a2e', markersize=12, zorder=15)
+    ax.scatter([x_star[0]], [x_star[1]], s=144, c='#1a1a2e', zorder=15)
     ax.annotate(r'$\mathbf{x}^*$', xy=(x_star[0], x_star[1]), 
                 xytext=(x_star[0] + 0.12, x_star[1] - 0.18),
                 fontsize=15, fontweight='bold', color='#1a1a2e')
@@ -116,30 +135,29 @@ def main():
     
     # Draw T(x*) as two rays (the V-shaped nonconvex cone)
     # Angles: approximately ±60 degrees from vertical
-    angle1 = np.radians(70)   # 70 degrees from horizontal
-    angle2 = np.radians(110)  # 110 degrees from horizontal
-    
+    # Evaluate radians/cos/sin once on a small array rather than repeating
+    # scalar ufunc calls for every ray
+    angles_deg = np.array([70.0, 110.0])  # degrees from horizontal
+    cos_a, sin_a = np.cos(np.radians(angles_deg)), np.sin(np.radians(angles_deg))
+
     ray_length = 1.0
-    
+
     # Ray 1 (right branch tangent direction)
-    ray1_end = (ray_length * np.cos(angle1), ray_length * np.sin(angle1))
+    ray1_end = (ray_length * cos_a[0], ray_length * sin_a[0])
     ax.annotate('', xy=ray1_end, xytext=(0, 0),
-                arrowprops=dict(arrowstyle='-|>', color='#c62828', lw=3, 
+                arrowprops=dict(arrowstyle='-|>', color='#c62828', lw=3,
                                mutation_scale=18), zorder=10)
-    
+
     # Ray 2 (left branch tangent direction)
-    ray2_end = (ray_length * np.cos(angle2), ray_length * np.sin(angle2))
+    ray2_end = (ray_length * cos_a[1], ray_length * sin_a[1])
     ax.annotate('', xy=ray2_end, xytext=(0, 0),
                 arrowprops=dict(arrowstyle='-|>', color='#c62828', lw=3,
                                mutation_scale=18), zorder=10)
-    
+
     # Fill between the rays to show T(x*) more clearly
-    # Create a thin wedge for visualization
-    t_angles = np.linspace(angle1, angle2, 50)
-    t_x = [0] + [0.85 * np.cos(a) for a in t_angles] + [0]
-    t_y = [0] + [0.85 * np.sin(a) for a in t_angles] + [0]
-    tangent_cone_fill = Polygon(list(zip(t_x, t_y)), 
-                                 facecolor='#ffcdd2', edgecolor='none', alpha=0.5)
+    # A single Wedge primitive replaces the hand-built 52-vertex polygon
+    tangent_cone_fill = Wedge((0, 0), 0.85, angles_deg[0], angles_deg[1],
+                              facecolor='#ffcdd2', edgecolor='none', alpha=0.5)
     ax.add_patch(tangent_cone_fill)
     
     # Label for T(x*)
@@ -155,10 +173,10 @@ def main():
     # Constraint labels
     ax.text(-1.1, 0.95, r'$g_1(\mathbf{x}) = 0$', fontsize=11, color='#2c3e50',
             fontweight='bold', rotation=50,
-            bbox=dict(boxstyle='round,pad=0.25', fc='white', ec='none', alpha=0.9))
+            bbox=CURVE_LABEL_BBOX)
     ax.text(1.1, 0.95, r'$g_2(\mathbf{x}) = 0$', fontsize=11, color='#2c3e50',
             fontweight='bold', rotation=-50,
-            bbox=dict(boxstyle='round,pad=0.25', fc='white', ec='none', alpha=0.9))
+            bbox=CURVE_LABEL_BBOX)
     
     # Feasible region label
     ax.text(0.0, 1.75, 'Feasible Region', fontsize=11, ha='center', va='center',
@@ -192,15 +210,10 @@ def main():
     ax.set_ylabel(r'$x_2$', fontsize=14, fontweight='bold')
     ax.tick_params(labelsize=11)
     
-    # Remove top and right spines
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.spines['left'].set_linewidth(1.2)
-    ax.spines['bottom'].set_linewidth(1.2)
-    
-    plt.tight_layout()
+    fig.tight_layout()
     outname = "acq_failure.png"
-    fig.savefig(outname, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
+    fig.savefig(outname, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none',
+                pil_kwargs=academic_style.PNG_KWARGS)
     print(f"Saved figure: {outname}")
 
 if __name__ == "__main__":
@@ -0,0 +1,27 @@
+# build_all_figures.py
+# Batch driver for the constraint-qualification illustrations.
+# Imports matplotlib once and reuses a single Figure across the scripts,
+# so repeat backend initialization, font-cache loading, and figure
+# allocation are paid once per build instead of once per figure.
+# Requires: numpy, matplotlib
+# Output: acq_failure.png, gcq_illustration.png, licq_violation.png
+
+import matplotlib
+matplotlib.use('Agg')  # savefig-only build, no interactive backend probe
+import matplotlib.pyplot as plt
+
+import acq_failure
+import gcq_illustration
+import licq_violation
+
+FIGURE_MODULES = [acq_failure, gcq_illustration, licq_violation]
+
+def main():
+    # One Figure shared by every script; each main() clears and resizes it
+    fig = plt.figure()
+    for module in FIGURE_MODULES:
+        module.main(fig)
+    plt.close(fig)
+
+if __name__ == "__main__":
+    main()
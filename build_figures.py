@@ -0,0 +1,41 @@
+# build_figures.py
+# Parallel batch driver for the MPEC illustration scripts. The figures are
+# independent standalone programs, so running them in worker processes hides
+# each one's matplotlib import and render latency behind the others on
+# multi-core machines. (build_all_figures.py is the complementary in-process
+# driver for the scripts that share a single Figure.)
+# Requires: numpy, matplotlib
+# Output: mfcq_illustration.png, mpec_acq.png, mpec_cq_hierarchy.png,
+#         mpec_feasible_region.png, mpec_gcq.png, mpec_intersection.png,
+#         mpec_licq.png, mpec_mfcq.png
+
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+FIGURE_SCRIPTS = [
+    'mfcq_illustration.py',
+    'mpec_acq.py',
+    'mpec_cq_hierarchy.py',
+    'mpec_feasible_region.py',
+    'mpec_gcq.py',
+    'mpec_intersection.py',
+    'mpec_licq.py',
+    'mpec_mfcq.py',
+]
+
+def run_script(script):
+    # Resolve scripts next to this driver; PNGs land in the caller's cwd
+    return subprocess.run([sys.executable, os.path.join(_HERE, script)],
+                          check=True)
+
+def main():
+    with ProcessPoolExecutor(max_workers=len(FIGURE_SCRIPTS)) as ex:
+        # list() drains the iterator so worker exceptions surface here
+        list(ex.map(run_script, FIGURE_SCRIPTS))
+
+if __name__ == "__main__":
+    main()
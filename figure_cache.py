@@ -0,0 +1,50 @@
+# figure_cache.py
+# On-disk build cache for the figure scripts: skip re-rendering a figure
+# when its generating source (and matplotlib itself) have not changed since
+# the PNG was last written. Keyed on a SHA-256 of the script contents, the
+# shared style module and the matplotlib version, stored in a sidecar
+# <outname>.cachehash file.
+# Requires: matplotlib
+
+import functools
+import hashlib
+import os
+
+import matplotlib
+
+# Shared modules whose settings feed every figure (rcParams, PNG encoder
+# kwargs); folding their source into each digest means e.g. flipping
+# academic_style.HIGH_QUALITY invalidates the cached PNGs
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SHARED_SOURCES = [os.path.join(_HERE, 'academic_style.py')]
+
+def _source_hash(script_path):
+    digest = hashlib.sha256()
+    for path in [script_path] + _SHARED_SOURCES:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    digest.update(matplotlib.__version__.encode())
+    return digest.hexdigest()
+
+def cached_figure(outname):
+    """Decorator that skips the wrapped figure builder when `outname`
+    is already up to date for the current script source."""
+    def decorator(func):
+        script_path = func.__globals__['__file__']
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            sidecar = outname + '.cachehash'
+            current = _source_hash(script_path)
+            if os.path.exists(outname) and os.path.exists(sidecar):
+                with open(sidecar) as f:
+                    if f.read().strip() == current:
+                        print(f"Up to date: {outname}")
+                        return
+            result = func(*args, **kwargs)
+            with open(sidecar, 'w') as f:
+                f.write(current + '\n')
+            return result
+
+        return wrapper
+    return decorator
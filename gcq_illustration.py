@@ -6,38 +6,36 @@
 # Output: gcq_illustration.png
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # savefig-only script; skip the interactive backend probe
 import matplotlib.pyplot as plt
-from matplotlib.patches import Polygon, FancyArrowPatch, Arc
-from matplotlib.lines import Line2D
+from matplotlib.patches import Wedge
+from matplotlib.collections import LineCollection
 
-def draw_cone(ax, origin, angle1, angle2, length, facecolor, edgecolor, 
+import academic_style
+from figure_cache import cached_figure
+
+def draw_cone(ax, origin, angle1, angle2, length, facecolor, edgecolor,
               alpha=0.3, linewidth=2, label_pos=None, label=None, label_color='black'):
     """Draw a 2D cone as a filled wedge with boundary rays."""
-    
-    # Create cone boundary points
-    n_points = 50
-    angles = np.linspace(np.radians(angle1), np.radians(angle2), n_points)
-    
-    # Cone vertices
-    x_pts = [origin[0]] + [origin[0] + length * np.cos(a) for a in angles] + [origin[0]]
-    y_pts = [origin[1]] + [origin[1] + length * np.sin(a) for a in angles] + [origin[1]]
-    
-    # Draw filled cone
-    cone = Polygon(list(zip(x_pts, y_pts)), facecolor=facecolor, 
-                   edgecolor='none', alpha=alpha, zorder=2)
+
+    # Draw the filled cone as a single Wedge primitive instead of
+    # hand-tessellating a 52-vertex Polygon
+    cone = Wedge(origin, length, angle1, angle2, facecolor=facecolor,
+                 edgecolor='none', alpha=alpha, zorder=2)
     ax.add_patch(cone)
-    
-    # Draw boundary rays
-    ray1_end = (origin[0] + length * np.cos(np.radians(angle1)), 
+
+    # Draw both boundary rays as one LineCollection instead of two plot calls
+    ray1_end = (origin[0] + length * np.cos(np.radians(angle1)),
                 origin[1] + length * np.sin(np.radians(angle1)))
-    ray2_end = (origin[0] + length * np.cos(np.radians(angle2)), 
+    ray2_end = (origin[0] + length * np.cos(np.radians(angle2)),
                 origin[1] + length * np.sin(np.radians(angle2)))
-    
-    ax.plot([origin[0], ray1_end[0]], [origin[1], ray1_end[1]], 
-            color=edgecolor, linewidth=linewidth, solid_capstyle='round', zorder=3)
-    ax.plot([origin[0], ray2_end[0]], [origin[1], ray2_end[1]], 
-            color=edgecolor, linewidth=linewidth, solid_capstyle='round', zorder=3)
-    
+
+    rays = LineCollection([[origin, ray1_end], [origin, ray2_end]],
+                          colors=edgecolor, linewidths=linewidth,
+                          capstyle='round', zorder=3)
+    ax.add_collection(rays)
+
     # Add arrowheads
     arrow_len = 0.92
     for angle in [angle1, angle2]:
@@ -58,9 +56,17 @@ def draw_cone(ax, origin, angle1, angle2, length, facecolor, edgecolor,
     
     return cone
 
-def main():
-    fig, axes = plt.subplots(1, 2, figsize=(14, 7))
-    
+@cached_figure("gcq_illustration.png")
+def main(fig=None):
+    # Reuse a caller-supplied Figure (see build_all_figures.py) to skip
+    # repeated figure allocation in batch builds
+    if fig is None:
+        fig = plt.figure(figsize=(14, 7))
+    else:
+        fig.clf()
+        fig.set_size_inches(14, 7)
+    axes = fig.subplots(1, 2)
+
     # =========================================
     # LEFT PANEL: Primal Cones T(x*) and L(x*)
     # =========================================
@@ -88,7 +94,7 @@ def main():
               label_pos=(1.85, 0.85), label=r'$L(\mathbf{x}^*)$', label_color='#0d47a1')
     
     # Mark x*
-    ax1.plot(origin[0], origin[1], 'ko', markersize=10, zorder=10)
+    ax1.scatter([origin[0]], [origin[1]], s=100, c='black', zorder=10)
     ax1.text(origin[0] - 0.15, origin[1] - 0.15, r'$\mathbf{x}^*$', 
              fontsize=14, fontweight='bold', ha='center')
     
@@ -150,7 +156,7 @@ def main():
               label_pos=(0.85, 0.4), label=r'$L(\mathbf{x}^*)^\circ$', label_color='#6a1b9a')
     
     # Mark origin
-    ax2.plot(origin2[0], origin2[1], 'ko', markersize=10, zorder=10)
+    ax2.scatter([origin2[0]], [origin2[1]], s=100, c='black', zorder=10)
     ax2.text(origin2[0] + 0.15, origin2[1] - 0.15, r'$\mathbf{0}$', 
              fontsize=14, fontweight='bold', ha='center')
     
@@ -173,9 +179,10 @@ def main():
     fig.patches.append(plt.Arrow(0.48, 0.5, 0.04, 0, width=0.03, 
                                   transform=fig.transFigure, color='#78909c', alpha=0.6))
     
-    plt.tight_layout(rect=[0, 0.05, 1, 1])
+    fig.tight_layout(rect=[0, 0.05, 1, 1])
     outname = "gcq_illustration.png"
-    fig.savefig(outname, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
+    fig.savefig(outname, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none',
+                pil_kwargs=academic_style.PNG_KWARGS)
     print(f"Saved figure: {outname}")
 
 if __name__ == "__main__":
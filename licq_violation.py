@@ -5,23 +5,19 @@
 # Output: licq_violation.png
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # savefig-only script; skip the interactive backend probe
 import matplotlib.pyplot as plt
-from matplotlib.patches import FancyArrowPatch
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.patches import Circle, FancyArrowPatch
 
-def g1(x, y):
-    """First constraint: g1(x,y) <= 0 (curved boundary)"""
-    return (x - 0.5)**2 + (y - 1.5)**2 - 1.0
+import academic_style
+from figure_cache import cached_figure
 
-def g2(x, y):
-    """Second constraint: g2(x,y) <= 0 (another curved boundary, tangent to g1)"""
-    return (x - 0.5)**2 + (y + 0.5)**2 - 1.0
+academic_style.apply()
 
-def compute_grid(xmin=-1.0, xmax=2.0, ymin=-0.5, ymax=2.5, n=800):
-    xs = np.linspace(xmin, xmax, n)
-    ys = np.linspace(ymin, ymax, n)
-    X, Y = np.meshgrid(xs, ys)
-    return X, Y, g1(X, Y), g2(X, Y)
+# Shared bbox style for the constraint labels; reusing one dict avoids
+# rebuilding identical FancyBboxPatch settings per ax.text call
+CURVE_LABEL_BBOX = dict(boxstyle='round,pad=0.3', fc='white', ec='none', alpha=0.9)
 
 def gradient_g1(x, y):
     """Gradient of g1"""
@@ -31,7 +27,8 @@ def gradient_g2(x, y):
     """Gradient of g2"""
     return np.array([2*(x - 0.5), 2*(y + 0.5)])
 
-def main():
+@cached_figure("licq_violation.png")
+def main(fig=None):
     # The point where both constraints are active (intersection)
     # For these two circles centered at (0.5, 1.5) and (0.5, -0.5) with radius 1,
     # they intersect at x = 0.5, y = 0.5 (on the line x = 0.5)
@@ -45,33 +42,34 @@ def main():
     grad_g1_norm = grad_g1 / np.linalg.norm(grad_g1) * 0.6
     grad_g2_norm = grad_g2 / np.linalg.norm(grad_g2) * 0.5
     
-    # Grid for plotting
-    X, Y, G1, G2 = compute_grid()
-    
-    # Feasible region: g1 <= 0 AND g2 <= 0
-    feasible = ((G1 <= 0) & (G2 <= 0)).astype(float)
-    
     # --- Plotting ---
-    fig, ax = plt.subplots(figsize=(10, 11))
+    # Reuse a caller-supplied Figure (see build_all_figures.py) to skip
+    # repeated figure allocation in batch builds
+    if fig is None:
+        fig = plt.figure(figsize=(10, 11))
+    else:
+        fig.clf()
+        fig.set_size_inches(10, 11)
+    ax = fig.add_subplot()
     ax.set_aspect('equal')
     ax.set_xlim(-0.8, 2.0)
     ax.set_ylim(-0.5, 2.8)
     
-    # Subtle grid
-    ax.grid(True, alpha=0.15, linestyle='-', linewidth=0.5, color='#666666')
-    
-    # Color scheme: muted blue/gray academic style
-    feasible_color = '#e8eef5'  # Very light blue-gray for feasible region
+    # Subtle grid (cosmetics come from academic_style rcParams)
+    ax.grid(True)
     
-    # Shade the feasible region
-    ax.contourf(X, Y, feasible, levels=[0.5, 1.5], colors=[feasible_color], alpha=0.8)
-    
-    # Draw constraint boundaries with clean thin strokes
-    ax.contour(X, Y, G1, levels=[0], colors=['#2c3e50'], linewidths=2.0, linestyles='-')
-    ax.contour(X, Y, G2, levels=[0], colors=['#2c3e50'], linewidths=2.0, linestyles='-')
+    # The constraint boundaries are exact circles, so draw them analytically
+    # instead of rasterizing a grid and running marching squares over it.
+    # The circles are tangent at x*, so the feasible set g1 <= 0 and g2 <= 0
+    # degenerates to that single point and there is no lens region to shade
+    # (the old contourf of the feasibility mask drew nothing either).
+    ax.add_patch(Circle((0.5, 1.5), 1.0, fill=False, edgecolor='#2c3e50',
+                        linewidth=2.0))
+    ax.add_patch(Circle((0.5, -0.5), 1.0, fill=False, edgecolor='#2c3e50',
+                        linewidth=2.0))
     
     # Mark the critical point x*
-    ax.plot(x_star[0], x_star[1], 'o', color='#1a1a2e', markersize=10, zorder=10)
+    ax.scatter([x_star[0]], [x_star[1]], s=100, c='#1a1a2e', zorder=10)
     ax.annotate(r'$\mathbf{x}^*$', xy=(x_star[0], x_star[1]), 
                 xytext=(x_star[0] + 0.15, x_star[1] + 0.08),
                 fontsize=14, fontweight='bold', color='#1a1a2e')
@@ -113,10 +111,10 @@ def main():
     # Constraint labels on the curves
     ax.text(1.4, 1.9, r'$g_1(\mathbf{x}) = 0$', fontsize=12, color='#2c3e50',
             fontweight='bold', rotation=-45,
-            bbox=dict(boxstyle='round,pad=0.3', fc='white', ec='none', alpha=0.9))
+            bbox=CURVE_LABEL_BBOX)
     ax.text(1.4, 0.1, r'$g_2(\mathbf{x}) = 0$', fontsize=12, color='#2c3e50',
             fontweight='bold', rotation=45,
-            bbox=dict(boxstyle='round,pad=0.3', fc='white', ec='none', alpha=0.9))
+            bbox=CURVE_LABEL_BBOX)
     
     # Label for feasible region
     ax.text(0.5, 1.0, 'Feasible\nRegion', fontsize=11, ha='center', va='center',
@@ -147,15 +145,10 @@ def main():
     ax.set_ylabel(r'$x_2$', fontsize=14, fontweight='bold')
     ax.tick_params(labelsize=11)
     
-    # Remove top and right spines for cleaner look
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.spines['left'].set_linewidth(1.2)
-    ax.spines['bottom'].set_linewidth(1.2)
-    
-    plt.tight_layout()
+    fig.tight_layout()
     outname = "licq_violation.png"
-    fig.savefig(outname, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
+    fig.savefig(outname, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none',
+                pil_kwargs=academic_style.PNG_KWARGS)
     print(f"Saved figure: {outname}")
 
 if __name__ == "__main__":
@@ -5,10 +5,19 @@
 # Output: mpec_acq.png
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # savefig-only script; skip the interactive backend probe
 import matplotlib.pyplot as plt
-from matplotlib.patches import FancyArrowPatch, Polygon, Wedge, Arc
+from matplotlib.patches import ArrowStyle, FancyArrowPatch, Polygon
 from matplotlib.lines import Line2D
 
+from figure_cache import cached_figure
+
+# One prebuilt ArrowStyle shared by all six ray patches; passing the spec
+# string instead would re-parse '-|>' through the style registry per patch
+_RAY_ARROW = ArrowStyle('-|>')
+
+@cached_figure("mpec_acq.png")
 def main():
     fig, axes = plt.subplots(1, 2, figsize=(14, 7))
     
@@ -78,26 +87,33 @@ def main():
     theta2_start = angle_H
     theta2_end = angle_H + 90  # perpendicular into feasible
     
+    # Sample both arcs through one concatenated angle array so cos/sin run
+    # as a single ufunc call each, then split the halves per wedge
+    angles = np.concatenate([
+        np.linspace(np.radians(theta1_start), np.radians(theta1_end), n_pts),
+        np.linspace(np.radians(theta2_start), np.radians(theta2_end), n_pts),
+    ])
+    cx = x_star[0] + cone_radius * np.cos(angles)
+    cy = x_star[1] + cone_radius * np.sin(angles)
+    cone1_x, cone2_x = cx[:n_pts], cx[n_pts:]
+    cone1_y, cone2_y = cy[:n_pts], cy[n_pts:]
+
     # Draw first cone section (lower)
-    angles1 = np.linspace(np.radians(theta1_start), np.radians(theta1_end), n_pts)
-    cone1_x = x_star[0] + cone_radius * np.cos(angles1)
-    cone1_y = x_star[1] + cone_radius * np.sin(angles1)
-    cone1_pts = [(x_star[0], x_star[1])] + list(zip(cone1_x, cone1_y))
-    cone1_poly = Polygon(cone1_pts, facecolor=color_tangent, alpha=0.25, 
+    # Shared by both panels; a contiguous (n+1, 2) ndarray skips the slow
+    # list-of-tuples conversion inside Polygon
+    cone1_pts = np.column_stack([np.r_[x_star[0], cone1_x], np.r_[x_star[1], cone1_y]])
+    cone1_poly = Polygon(cone1_pts, facecolor=color_tangent, alpha=0.25,
                          edgecolor='none', zorder=2)
     ax1.add_patch(cone1_poly)
-    
+
     # Draw second cone section (upper)
-    angles2 = np.linspace(np.radians(theta2_start), np.radians(theta2_end), n_pts)
-    cone2_x = x_star[0] + cone_radius * np.cos(angles2)
-    cone2_y = x_star[1] + cone_radius * np.sin(angles2)
-    cone2_pts = [(x_star[0], x_star[1])] + list(zip(cone2_x, cone2_y))
+    cone2_pts = np.column_stack([np.r_[x_star[0], cone2_x], np.r_[x_star[1], cone2_y]])
     cone2_poly = Polygon(cone2_pts, facecolor=color_tangent, alpha=0.25,
                          edgecolor='none', zorder=2)
     ax1.add_patch(cone2_poly)
     
     # Draw representative rays
-    arrow_style = dict(arrowstyle='-|>', mutation_scale=14, lw=2)
+    arrow_style = dict(arrowstyle=_RAY_ARROW, mutation_scale=14, lw=2)
     
     # Ray along G=0 (both directions for tangent)
     ray_len = 0.9
@@ -257,7 +273,10 @@ def main():
     fig.legend(handles=legend_elements, loc='lower center', ncol=4, fontsize=10,
                framealpha=0.95, edgecolor='#bdbdbd', bbox_to_anchor=(0.5, 0.01))
     
-    plt.tight_layout(rect=[0, 0.12, 1, 0.94])
+    # Fixed margins tuned once by eye (bottom clears the legend and the
+    # equality annotation, top clears the suptitle); tight_layout would
+    # re-measure every mathtext artist through the renderer for the same
+    fig.subplots_adjust(left=0.03, right=0.97, top=0.88, bottom=0.16)
     outname = "mpec_acq.png"
     fig.savefig(outname, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
     print(f"Saved figure: {outname}")
